@@ -1,4 +1,4 @@
-import time
+import threading
 
 from piston.instance import shared_steem_instance
 
@@ -20,6 +20,12 @@ virtual_operations = [
     "comment_payout_update"
 ]
 
+#: Maps the ``mode`` argument to the key in the dynamic global properties
+modes = {
+    "irreversible": "last_irreversible_block_num",
+    "head": "head_block_number",
+}
+
 
 class Blockchain(object):
     """ This class allows to access the blockchain and read data
@@ -37,13 +43,21 @@ class Blockchain(object):
     ):
         self.steem = steem_instance or shared_steem_instance()
 
-        if mode == "irreversible":
-            self.mode = 'last_irreversible_block_num'
-        elif mode == "head":
-            self.mode = "head_block_number"
-        else:
+        try:
+            self.mode = modes[mode]
+        except KeyError:
             raise ValueError("invalid value for 'mode'!")
 
+        self._stopped = threading.Event()
+
+    def stop(self):
+        """ Stop the running ``blocks()``, ``ops()`` and ``stream()``
+            generators of this instance, e.g. from another thread. They
+            return before the next block instead of waiting for it.
+            Generators that are started afterwards are not affected.
+        """
+        self._stopped.set()
+
     def info(self):
         """ This call returns the *dynamic global properties*
         """
@@ -102,6 +116,16 @@ class Blockchain(object):
         if not start:
             start = self.get_current_block_num()
 
+        # Irreversible blocks can't be forked out and may thus be cached.
+        # Only a bounded range may be read again (e.g. by a replay), an
+        # open-ended stream never reads a block twice
+        if stop and self.mode == "last_irreversible_block_num":
+            get_block = self.steem.rpc.get_irreversible_block
+        else:
+            get_block = self.steem.rpc.get_block
+
+        self._stopped.clear()
+
         # We are going to loop indefinitely
         while True:
             retry = False
@@ -114,13 +138,15 @@ class Blockchain(object):
 
             # Blocks from start until head block
             for blocknum in range(start, head_block + 1):
+                if self._stopped.is_set():
+                    return
                 # Get full block
-                block = self.steem.rpc.get_block(blocknum)
+                block = get_block(blocknum)
                 if not block:
                     start = blocknum
                     retry = True
                     break
-                block.update({"block_num": blocknum})
+                block["block_num"] = blocknum
                 yield block
 
             if retry:
@@ -132,8 +158,9 @@ class Blockchain(object):
             if stop and start > stop:
                 break
 
-            # Sleep for one block
-            time.sleep(block_interval)
+            # Sleep for one block (unless we are told to stop)
+            if self._stopped.wait(block_interval):
+                break
 
     def ops(self, start=None, stop=None, only_virtual_ops=False, **kwargs):
         """ Yields all operations (including virtual operations) starting from ``start``.
@@ -168,6 +195,8 @@ class Blockchain(object):
         if not start:
             start = self.get_current_block_num()
 
+        self._stopped.clear()
+
         # We are going to loop indefinitely
         while True:
 
@@ -176,6 +205,8 @@ class Blockchain(object):
 
             # Blocks from start until head block
             for blocknum in range(start, head_block + 1):
+                if self._stopped.is_set():
+                    return
                 # Get full block
                 ops = self.get_ops_in_block(blocknum, only_virtual_ops)
                 for op in ops:
@@ -188,8 +219,9 @@ class Blockchain(object):
             if stop and start > stop:
                 break
 
-            # Sleep for one block
-            time.sleep(block_interval)
+            # Sleep for one block (unless we are told to stop)
+            if self._stopped.wait(block_interval):
+                break
 
     def get_ops_in_block(self, blocknum, only_virtual_ops=False):
         """ Get all the operations from the block
@@ -1,14 +1,71 @@
 import re
 import time
+import random
+import functools
+import importlib
+import json
+import queue
+import select
+import ssl
+import threading
+import websocket
+from itertools import cycle
+from collections import OrderedDict
 from . import exceptions
 from .exceptions import NoAccessApi, RPCError
-from grapheneapi.graphenewsrpc import GrapheneWebsocketRPC
+from grapheneapi.graphenewsrpc import GrapheneWebsocketRPC, NumRetriesReached
 from pistonbase.chains import known_chains
 import logging
 import warnings
 warnings.filterwarnings('default', module=__name__)
 log = logging.getLogger(__name__)
 
+#: Backoff (in seconds) between reconnection attempts in ``rpcexec``
+backoff_base = 0.5
+backoff_cap = 10
+#: Seconds to wait for a spare connection to open or to reply to the
+#: login before it is given up (unless ``timeout`` is set)
+spare_timeout = 5
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@functools.lru_cache(maxsize=None)
+def _lazy(module, name):
+    """ Resolve ``module.name`` on first use and cache it. ``piston``
+        imports this module, so we can not import from ``piston`` at
+        module level.
+    """
+    return getattr(importlib.import_module(module), name)
+
+
+def _dumps(payload):
+    """ Encode a JSON-RPC payload into the utf8 bytes we send over the
+        websocket. Uses ``orjson`` if available.
+    """
+    if orjson:
+        try:
+            return orjson.dumps(payload)
+        except TypeError:
+            pass
+    return json.dumps(payload, ensure_ascii=False).encode('utf8')
+
+
+def _loads(reply):
+    """ Decode a reply from the node. Uses ``orjson`` if available and
+        falls back to the (non-strict) stdlib parser for replies that
+        ``orjson`` refuses (e.g. raw control characters in strings).
+    """
+    if orjson:
+        try:
+            return orjson.loads(reply)
+        except ValueError:
+            pass
+    return json.loads(reply, strict=False)
+
 
 class SteemNodeRPC(GrapheneWebsocketRPC):
     """ This class allows to call API methods synchronously, without
@@ -21,6 +78,19 @@ class SteemNodeRPC(GrapheneWebsocketRPC):
         :param str user: Username for Authentication
         :param str password: Password for Authentication
         :param Array apis: List of APIs to register to (default: ["database", "network_broadcast"])
+        :param int spare_connections: Number of additional connections
+            that are opened in the background and kept ready to take
+            over if the active connection drops (default: 0)
+        :param float timeout: Seconds to wait for a reply before the
+            connection is considered dead and re-established (default:
+            ``None``, wait forever)
+        :param int block_cache_size: Number of irreversible blocks kept
+            in memory by ``get_irreversible_block``. Only worth enabling
+            if the same blocks are read repeatedly, e.g. when replaying
+            a range (default: 0, disabled)
+        :param bool batch: Register to all APIs with a single JSON-RPC
+            batch request. Only enable this if the node supports batch
+            requests (default: ``False``)
 
         Available APIs
 
@@ -38,7 +108,6 @@ class SteemNodeRPC(GrapheneWebsocketRPC):
 
     """
     call_id = 0
-    api_id = {}
 
     def __init__(self,
                  urls,
@@ -49,16 +118,184 @@ class SteemNodeRPC(GrapheneWebsocketRPC):
             "apis",
             ["database", "network_broadcast"]
         )
+        self.spare_connections = kwargs.pop("spare_connections", 0)
+        # spares rotate through the nodes independently of ``self.urls``
+        self._node_urls = urls if isinstance(urls, list) else [urls]
+        self._spare_urls = cycle(self._node_urls)
+        self.timeout = kwargs.pop("timeout", None)
+        self.batch = kwargs.pop("batch", False)
+        self.block_cache_size = kwargs.pop("block_cache_size", 0)
+        self._block_cache = OrderedDict()
+        self._spares = queue.Queue()
+        self._lock = threading.RLock()
         super(SteemNodeRPC, self).__init__(urls, user, password, **kwargs)
         self.chain_params = self.get_network()
+        self._warm_up(self.spare_connections)
+
+    def _open(self, url):
+        """ Open a websocket to ``url`` the same way ``wsconnect`` does,
+            but give up after ``self.timeout`` (or ``spare_timeout``)
+            seconds.
+        """
+        if url[:3] == "wss":
+            ws = websocket.WebSocket(sslopt={'cert_reqs': ssl.CERT_NONE})
+        else:
+            ws = websocket.WebSocket()
+        ws.connect(url, timeout=self.timeout or spare_timeout)
+        # like the connections from ``wsconnect``, replies are awaited
+        # through ``_recv``
+        ws.settimeout(None)
+        return ws
+
+    def _warm_up(self, num):
+        """ Open ``num`` spare connections in a background thread so
+            that the websocket (and TLS) handshake is already done
+            when we need to fail over.
+        """
+        if num <= 0:
+            return
+        urls = [self._next_spare_url() for _ in range(num)]
+
+        def connect():
+            for url in urls:
+                try:
+                    self._spares.put((url, self._open(url)))
+                except Exception as e:
+                    log.debug("Could not open spare connection to %s: %s" % (url, str(e)))
+
+        threading.Thread(target=connect, daemon=True).start()
+
+    def _next_spare_url(self):
+        """ Next node to open a spare connection to. The active node is
+            skipped if there is another one, as a spare on it would go
+            down together with the active connection.
+        """
+        for _ in self._node_urls:
+            url = next(self._spare_urls)
+            if url != self.url:
+                break
+        return url
+
+    def _login(self, url, ws):
+        """ Log in on a spare connection. Spares may have been idle for
+            a long time, so this also tells us whether the node still
+            talks to us. We wait at most ``self.timeout`` (or
+            ``spare_timeout``) seconds for the reply.
+
+            :returns: ``True`` if the node replied
+        """
+        try:
+            ws.send(_dumps({
+                "method": "call",
+                "params": [1, "login", [self.user, self.password]],
+                "jsonrpc": "2.0",
+                "id": self.get_request_id()
+            }))
+            reply = self._recv(
+                ws, url=url, timeout=self.timeout or spare_timeout)
+            return "result" in _loads(reply)
+        except Exception as e:
+            log.debug("Dropping stale spare connection to %s: %s" % (url, str(e)))
+            return False
+
+    def _reconnect(self):
+        """ Close the current connection and replace it, preferably with
+            an already opened spare connection, and register to the
+            APIs again. Spares that no longer respond are closed and
+            replaced.
+        """
+        try:
+            self.ws.close()
+        except Exception:
+            pass
+        adopted = False
+        taken = 0
+        while not adopted:
+            try:
+                url, ws = self._spares.get_nowait()
+            except queue.Empty:
+                break
+            taken += 1
+            adopted = self._login(url, ws)
+            if adopted:
+                self.url, self.ws = url, ws
+            else:
+                ws.close()
+        self._warm_up(taken)
+        if not adopted:
+            self.wsconnect()
+        self.register_apis()
 
     def register_apis(self, apis=None):
-        for api in (apis or self.apis):
-            api = api.replace("_api", "")
-            self.api_id[api] = self.get_api_by_name("%s_api" % api, api_id=1)
-            if not self.api_id[api] and not isinstance(self.api_id[api], int):
+        apis = [api.replace("_api", "") for api in (apis or self.apis)]
+        if self.batch:
+            ids = self.rpcexec_batch([
+                {"method": "call",
+                 "params": [1, "get_api_by_name", ["%s_api" % api]],
+                 "jsonrpc": "2.0",
+                 "id": i}
+                for i, api in enumerate(apis)
+            ])
+        else:
+            ids = [self.get_api_by_name("%s_api" % api, api_id=1) for api in apis]
+        for api, api_id in zip(apis, ids):
+            self.api_id[api] = api_id
+            if not api_id and not isinstance(api_id, int):
                 raise NoAccessApi("No permission to access %s API. " % api)
 
+    def rpcexec_batch(self, payloads):
+        """ Execute several calls with a single JSON-RPC batch request,
+            i.e. in one round trip.
+
+            :param list payloads: List of payloads (with distinct ``id``)
+            :returns: List of results in the order of ``payloads``
+            :raises RPCError: if the node returns an error for any call
+        """
+        try:
+            replies = _loads(self._send_recv(payloads))
+        except ValueError:
+            raise ValueError("Client returned invalid format. Expected JSON!")
+        if not isinstance(replies, list):
+            error = replies.get("error", {}) if isinstance(replies, dict) else {}
+            raise RPCError(error.get("message", "Batch requests not supported"))
+        replies = {r.get("id"): r for r in replies}
+        ret = []
+        for payload in payloads:
+            reply = replies.get(payload["id"], {})
+            if "result" not in reply:
+                error = reply.get("error", {})
+                raise RPCError(error.get("detail", error.get("message", "No reply")))
+            ret.append(reply["result"])
+        return ret
+
+    def get_irreversible_block(self, blocknum):
+        """ Same as ``get_block`` but keeps the most recently used
+            blocks in memory. Irreversible blocks never change, so
+            rewinding or re-scanning a range does not hit the node
+            again.
+
+            .. note:: Only use this for blocks that are known to be
+                      irreversible. Blocks above the last irreversible
+                      block may still be forked out!
+
+            :param int blocknum: Block number
+            :returns: A (shallow) copy of the block. Nested data (e.g.
+                ``transactions``) is shared with the cache and must not
+                be modified.
+        """
+        with self._lock:
+            cache = self._block_cache
+            if blocknum in cache:
+                cache.move_to_end(blocknum)
+                return dict(cache[blocknum])
+            block = self.get_block(blocknum)
+            if block and self.block_cache_size > 0:
+                cache[blocknum] = block
+                if len(cache) > self.block_cache_size:
+                    cache.popitem(last=False)
+                return dict(block)
+            return block
+
     def get_account(self, name):
         account = self.get_accounts([name])
         if account:
@@ -70,7 +307,7 @@ class SteemNodeRPC(GrapheneWebsocketRPC):
             "The block_stream() call has been moved to `steem.account.Account.rawhistory()`",
             DeprecationWarning
         )
-        from piston.account import Account
+        Account = _lazy("piston.account", "Account")
         return Account(account, steem_instance=self.steem).rawhistory(
             first=first, limit=limit,
             only_ops=only_ops,
@@ -81,7 +318,7 @@ class SteemNodeRPC(GrapheneWebsocketRPC):
             "The block_stream() call has been moved to `steem.blockchain.Blockchain.blocks()`",
             DeprecationWarning
         )
-        from piston.blockchain import Blockchain
+        Blockchain = _lazy("piston.blockchain", "Blockchain")
         return Blockchain(mode=mode).blocks(start, stop)
 
     def stream(self, opNames, *args, **kwargs):
@@ -89,7 +326,7 @@ class SteemNodeRPC(GrapheneWebsocketRPC):
             "The stream() call has been moved to `steem.blockchain.Blockchain.stream()`",
             DeprecationWarning
         )
-        from piston.blockchain import Blockchain
+        Blockchain = _lazy("piston.blockchain", "Blockchain")
         return Blockchain(mode=kwargs.get("mode", "irreversible")).stream(opNames, *args, **kwargs)
 
     def list_accounts(self, start=None, step=1000, limit=None, **kwargs):
@@ -97,7 +334,7 @@ class SteemNodeRPC(GrapheneWebsocketRPC):
             "The list_accounts() call has been moved to `steem.blockchain.Blockchain.get_all_accounts()`",
             DeprecationWarning
         )
-        from piston.blockchain import Blockchain
+        Blockchain = _lazy("piston.blockchain", "Blockchain")
         return Blockchain(mode=kwargs.get("mode", "irreversible")).get_all_accounts(start=start, steps=step, **kwargs)
 
     def get_network(self):
@@ -110,9 +347,82 @@ class SteemNodeRPC(GrapheneWebsocketRPC):
         assert chain in known_chains, "The chain you are connecting to is not supported"
         return known_chains.get(chain)
 
+    def _recv(self, ws=None, url=None, timeout=None):
+        """ Receive a reply but wait at most ``self.timeout`` seconds
+            for it to arrive.
+
+            :param WebSocket ws: Connection to read from (default: the
+                active one)
+            :param str url: Node of ``ws`` (default: the active one)
+            :param float timeout: Seconds to wait (default:
+                ``self.timeout``)
+            :raises WebSocketTimeoutException: if no reply arrived in time
+        """
+        ws = ws or self.ws
+        url = url or self.url
+        if timeout is None:
+            timeout = self.timeout
+        sock = ws.sock
+        # SSL sockets may have already buffered (decrypted) data that
+        # select() does not know about
+        if (timeout is not None and
+                not (hasattr(sock, "pending") and sock.pending())):
+            readable, _, _ = select.select([sock], [], [], timeout)
+            if not readable:
+                raise websocket.WebSocketTimeoutException(
+                    "No reply from %s within %s seconds" % (url, timeout)
+                )
+        return ws.recv()
+
+    def _send_recv(self, payload):
+        """ Send the payload and return the raw reply. If the connection
+            is lost, we reconnect (to the next node, if several are
+            given) with exponential backoff and resend the payload until
+            ``num_retries`` is reached.
+
+            This method is thread-safe.
+
+            :param json payload: Payload data
+            :raises NumRetriesReached: if no reply could be obtained
+        """
+        # A websocket carries one request/reply pair at a time. Hold
+        # the lock for the whole round trip (including reconnects) so
+        # that one instance can be shared between threads.
+        with self._lock:
+            cnt = 0
+            while True:
+                cnt += 1
+                try:
+                    self.ws.send(_dumps(payload))
+                    return self._recv()
+                except KeyboardInterrupt:
+                    raise
+                except Exception:
+                    if (self.num_retries > -1 and
+                            cnt > self.num_retries):
+                        raise NumRetriesReached()
+                    # exponential backoff with some jitter so that many
+                    # clients do not hammer a restarting node in lockstep
+                    sleeptime = (
+                        min(backoff_base * 2 ** (cnt - 1), backoff_cap) +
+                        random.uniform(0, 0.1)
+                    )
+                    log.warning(
+                        "Lost connection to node during rpcexec(): %s (%d/%d) "
+                        % (self.url, cnt, self.num_retries) +
+                        "Retrying in %.1f seconds" % sleeptime
+                    )
+                    time.sleep(sleeptime)
+                    # reconnect and resend the same payload
+                    try:
+                        self._reconnect()
+                    except Exception:
+                        pass
+
     def rpcexec(self, payload):
         """ Execute a call by sending the payload.
-            It makes use of the GrapheneRPC library.
+            Payloads are encoded and replies decoded with ``orjson``
+            if it is installed (stdlib ``json`` otherwise).
             In here, we mostly deal with Steem specific error handling
 
             :param json payload: Payload data
@@ -120,8 +430,21 @@ class SteemNodeRPC(GrapheneWebsocketRPC):
             :raises RPCError: if the server returns an error
         """
         try:
-            # Forward call to GrapheneWebsocketRPC and catch+evaluate errors
-            return super(SteemNodeRPC, self).rpcexec(payload)
+            reply = self._send_recv(payload)
+            try:
+                ret = _loads(reply)
+            except ValueError:
+                raise ValueError("Client returned invalid format. Expected JSON!")
+
+            log.debug(reply)
+
+            if 'error' in ret:
+                if 'detail' in ret['error']:
+                    raise RPCError(ret['error']['detail'])
+                else:
+                    raise RPCError(ret['error']['message'])
+            else:
+                return ret["result"]
         except RPCError as e:
             msg = exceptions.decodeRPCErrorMsg(e).strip()
             if msg == "Account already transacted this block.":
@@ -3,4 +3,5 @@ __all__ = ['transactions',
            'objecttypes',
            'operations',
            'memo',
-           'account']
+           'account',
+           'exceptions']
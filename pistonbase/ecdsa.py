@@ -0,0 +1,108 @@
+import hashlib
+import struct
+import logging
+from graphenebase.ecdsa import (
+    sign_message as graphene_sign_message,
+    verify_message as graphene_verify_message,
+    _is_canonical as is_canonical,
+)
+from graphenebase.account import PrivateKey
+from graphenebase.base58 import Base58
+log = logging.getLogger(__name__)
+
+try:
+    import coincurve
+    from coincurve._libsecp256k1 import ffi
+    from coincurve.ecdsa import (
+        cdata_to_der, deserialize_recoverable, recoverable_convert
+    )
+    # We rely on (partly private) API that differs between versions,
+    # make sure the installed version has it
+    _sig = coincurve.PrivateKey(b"\x01" * 32).sign_recoverable(
+        b"\x00" * 32, hasher=None,
+        custom_nonce=(ffi.NULL, ffi.new("unsigned char[32]")))
+    coincurve.PublicKey.from_signature_and_message(
+        _sig, b"\x00" * 32, hasher=None)
+    cdata_to_der(recoverable_convert(deserialize_recoverable(_sig)))
+    del _sig
+    USE_COINCURVE = True
+    log.debug("Loaded coincurve binding.")
+except (ImportError, AttributeError, TypeError):
+    USE_COINCURVE = False
+    log.debug("To speed up transactions signing install \n"
+              "    pip install coincurve")
+
+
+def sign_message(message, wif, hashfn=hashlib.sha256):
+    """ Sign a message with a wif key and return the compact signature
+
+        Uses libsecp256k1 (through ``coincurve``) if installed and
+        falls back to the pure python implementation of graphenebase
+        otherwise.
+
+        :param str message: Message to sign
+        :param wif: Private key in WIF format or as ``PrivateKey``
+    """
+    if not USE_COINCURVE:
+        if isinstance(wif, PrivateKey):
+            wif = str(wif)
+        return graphene_sign_message(message, wif, hashfn)
+
+    if not isinstance(message, bytes):
+        message = bytes(message, "utf-8")
+
+    digest = hashfn(message).digest()
+    if isinstance(wif, PrivateKey):
+        secret = bytes(wif)
+    else:
+        # Only decode the secret, a PrivateKey would also derive the
+        # public key
+        secret = bytes(Base58(wif))
+    privkey = coincurve.PrivateKey(secret)
+
+    cnt = 0
+    while True:
+        # The nonce is deterministic (RFC6979), a counter is fed as
+        # extra entropy to obtain a different one in every attempt
+        cnt += 1
+        ndata = ffi.new("unsigned char[32]", cnt.to_bytes(32, "little"))
+        sig = privkey.sign_recoverable(
+            digest, hasher=None, custom_nonce=(ffi.NULL, ndata))
+        signature, i = sig[:64], sig[64]
+        if is_canonical(signature):
+            i += 4   # compressed
+            i += 27  # compact
+            break
+
+    return struct.pack("<B", i) + signature
+
+
+def verify_message(message, signature, hashfn=hashlib.sha256):
+    """ Verify a compact signature and return the (compressed) public
+        key that created it
+
+        Uses libsecp256k1 (through ``coincurve``) if installed and
+        falls back to the pure python implementation of graphenebase
+        otherwise.
+
+        :param str message: Message that was signed
+        :param bytes signature: Compact signature
+    """
+    if not USE_COINCURVE:
+        return graphene_verify_message(message, signature, hashfn)
+
+    if not isinstance(message, bytes):
+        message = bytes(message, "utf-8")
+    if not isinstance(signature, bytes):
+        signature = bytes(signature, "utf-8")
+
+    digest = hashfn(message).digest()
+    recoverParameter = signature[0] - 4 - 27  # recover parameter only
+    sig = signature[1:] + bytes([recoverParameter])
+
+    pubkey = coincurve.PublicKey.from_signature_and_message(
+        sig, digest, hasher=None)
+    der = cdata_to_der(recoverable_convert(deserialize_recoverable(sig)))
+    if not pubkey.verify(der, digest, hasher=None):
+        raise ValueError("Invalid signature")
+    return pubkey.format(compressed=True)
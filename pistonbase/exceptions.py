@@ -0,0 +1,2 @@
+class MissingSignatureForKey(Exception):
+    pass
@@ -11,6 +11,10 @@ assert sys.version_info[0] == 3, "graphenelib requires python3"
 
 default_prefix = "STM"
 
+#: Packers for the memo's nonce (uint64) and checksum (uint32)
+nonce_struct = struct.Struct("<Q")
+check_struct = struct.Struct("<I")
+
 
 def get_shared_secret(priv, pub):
     """ Derive the share secret between ``priv`` and ``pub``
@@ -45,11 +49,11 @@ def init_aes(shared_secret, nonce):
     """
     " Seed "
     ss = unhexlify(shared_secret)
-    n = struct.pack("<Q", int(nonce))
+    n = nonce_struct.pack(int(nonce))
     encryption_key = hashlib.sha512(n + ss).hexdigest()
     " Check'sum' "
     check = hashlib.sha256(unhexlify(encryption_key)).digest()
-    check = struct.unpack_from("<I", check[:4])[0]
+    check = check_struct.unpack_from(check)[0]
     " AES "
     key = unhexlify(encryption_key[0:64])
     iv = unhexlify(encryption_key[64:96])
@@ -121,9 +125,9 @@ def decode_memo(priv, message):
     raw = raw[66:]
     to_key = PublicKey(raw[:66])
     raw = raw[66:]
-    nonce = str(struct.unpack_from("<Q", unhexlify(raw[:16]))[0])
+    nonce = str(nonce_struct.unpack_from(unhexlify(raw[:16]))[0])
     raw = raw[16:]
-    check = struct.unpack_from("<I", unhexlify(raw[:8]))[0]
+    check = check_struct.unpack_from(unhexlify(raw[:8]))[0]
     raw = raw[8:]
     cipher = raw
 
@@ -147,7 +151,7 @@ def decode_memo(priv, message):
     message = aes.decrypt(unhexlify(bytes(message, 'ascii')))
     try:
         return _unpad(message.decode('utf8'), 16)
-    except:
+    except (ValueError, IndexError, struct.error):
         raise ValueError(message)
 
 
@@ -56,3 +56,15 @@ operations["hardfork"] = 52
 operations["comment_payout_update"] = 53
 operations["return_vesting_delegation"] = 54
 operations["comment_benefactor_reward"] = 55
+
+#: Operation names by id
+operation_names = {v: k for k, v in operations.items()}
+
+
+def getOperationNameForId(i):
+    """ Convert an operation id into the corresponding string
+    """
+    name = operation_names.get(int(i))
+    if name is None:
+        return "Unknown Operation ID %d" % i
+    return name
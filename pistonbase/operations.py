@@ -1,6 +1,10 @@
+import sys
+from collections import OrderedDict
 import struct
 import json
-from collections import OrderedDict
+from functools import lru_cache, wraps
+from operator import itemgetter
+from decimal import Decimal
 from graphenebase.types import (
     Uint8, Int16, Uint16, Uint32, Uint64,
     Varint32, Int64, String, Bytes, Void,
@@ -8,15 +12,20 @@ from graphenebase.types import (
     Set, Fixed_array, Optional, Static_variant,
     Map, Id, VoteId, ObjectId,
 )
-from graphenebase.objects import GrapheneObject, isArgsThisClass
+from graphenebase.objects import GrapheneObject
 from graphenebase.account import PublicKey
 from graphenebase.operations import (
     Operation as GrapheneOperation
 )
-from .operationids import operations
+from .operationids import operations, operation_names, getOperationNameForId
 
 default_prefix = "STM"
 
+#: Mapping type for the (ordered) fields of operations and objects.
+#: Plain dicts keep their insertion order as of Python 3.7 and are
+#: cheaper to build and iterate than OrderedDict
+_fields = dict if sys.version_info >= (3, 7) else OrderedDict
+
 asset_precision = {
     "STEEM": 3,
     "VESTS": 6,
@@ -26,10 +35,118 @@ asset_precision = {
     "GBG": 3
 }
 
+#: Precision and serialized symbol (null-padded to 7 bytes) by asset
+asset_info = {
+    asset: (precision, bytes(asset + "\x00" * (7 - len(asset)), "ascii"))
+    for asset, precision in asset_precision.items()
+}
+
+#: Empty ``String``, shared by operations without memo
+empty_string = String("")
+
+#: Empty ``Optional``, shared as it only ever serializes to a zero byte
+optional_none = Optional(None)
+
+#: Serialized layout of an amount: int64 amount, int8 precision, asset
+amount_struct = struct.Struct("<qb7s")
+
+
+def isArgsThisClass(self, args):
+    """ Are we given a single instance of our own class (to be copied)?
+
+        Same as ``graphenebase.objects.isArgsThisClass`` but tries the
+        cheap identity check of the types before comparing class names.
+    """
+    return len(args) == 1 and (
+        type(args[0]) is type(self) or
+        type(args[0]).__name__ == type(self).__name__
+    )
+
+
+def graphene_init(init):
+    """ Decorator for the ``__init__`` of operations and objects.
+
+        Copies the data if given an instance of the same class, otherwise
+        calls ``init(self, kwargs)`` with the arguments given either as
+        single dictionary or as keyword arguments.
+    """
+    @wraps(init)
+    def __init__(self, *args, **kwargs):
+        if isArgsThisClass(self, args):
+            self.data = args[0].data
+            return
+        if len(args) == 1 and len(kwargs) == 0:
+            kwargs = args[0]
+        init(self, kwargs)
+    return __init__
+
+
+@lru_cache(maxsize=4096)
+def account_name(name):
+    """ ``String`` for an account name. The same few account names show
+        up in most operations, so their ``String`` instances are cached
+        and shared.
+    """
+    return String(name)
+
+
+@lru_cache(maxsize=1024)
+def public_key(key, prefix=default_prefix):
+    """ ``PublicKey`` for a key given in its string representation.
+        Decoding a key is expensive and the same keys (e.g. memo and
+        signing keys) are serialized over and over, so instances are
+        cached and shared.
+    """
+    return PublicKey(key, prefix=prefix)
+
+
+def transfer_memo(kwargs):
+    """ ``String`` for the optional memo of a transfer. Most transfers
+        come without memo and share the same empty ``String``.
+    """
+    memo = kwargs.get("memo")
+    if not memo:
+        return empty_string
+    return String(memo)
+
+
+def json_metadata(kwargs):
+    """ Obtain ``json_metadata`` from the operation's arguments as
+        string. Dictionaries and lists are encoded as JSON.
+    """
+    meta = kwargs.get("json_metadata")
+    if not meta:
+        return ""
+    if type(meta) is str:
+        return meta
+    if isinstance(meta, (dict, list)):
+        return json.dumps(meta)
+    return meta
+
 
 class Operation(GrapheneOperation):
     def __init__(self, op):
-        super(Operation, self).__init__(op)
+        if isinstance(op, list) and len(op) == 2:
+            if isinstance(op[0], int):
+                self.opId = op[0]
+                name = operation_names.get(self.opId)
+                if name is None:
+                    raise ValueError("Unknown operation")
+            else:
+                self.opId = operations.get(op[0], None)
+                name = op[0]
+                if self.opId is None:
+                    raise ValueError("Unknown operation")
+            klass = operation_klasses.get(name)
+            if klass is None:
+                raise NotImplementedError(
+                    "Unimplemented Operation %s" % (name[0].upper() + name[1:]))
+            self.name = klass.__name__
+            self.op = klass(op[1])
+        else:
+            self.op = op
+            self.name = type(self.op).__name__.lower()  # also store name
+            self.opId = operations[self.name]
 
     def operations(self):
         return operations
@@ -38,15 +155,13 @@ class Operation(GrapheneOperation):
         return Operation
 
     def getOperationNameForId(self, i):
-        for key in operations:
-            if int(operations[key]) is int(i):
-                return key
-        return "Unknown Operation ID %d" % i
+        return getOperationNameForId(i)
 
     def _getklass(self, name):
-        module = __import__("pistonbase.operations", fromlist=["operations"])
-        class_ = getattr(module, name)
-        return class_
+        return operation_klasses[name[0].lower() + name[1:]]
+
+    def __bytes__(self):
+        return operation_id_bytes[self.opId] + bytes(self.op)
 
     def __str__(self):
         return json.dumps([
@@ -65,29 +180,28 @@ class Permission(GrapheneObject):
             if len(args) == 1 and len(kwargs) == 0:
                 kwargs = args[0]
 
-            # Sort keys (FIXME: ideally, the sorting is part of Public
-            # Key and not located here)
-            kwargs["key_auths"] = sorted(
-                kwargs["key_auths"],
-                key=lambda x: repr(PublicKey(x[0], prefix=prefix)),
-                reverse=False,
-            )
-            kwargs["account_auths"] = sorted(
-                kwargs["account_auths"],
-                key=lambda x: x[0],
-                reverse=False,
-            )
+            # Parse every public key only once and decorate it with its
+            # sort key, the serialized (compressed) key. ``repr()`` is
+            # its hex encoding, so the order is the same without the
+            # encoding step (FIXME: ideally, the sorting is part of
+            # Public Key and not located here)
+            keyAuths = []
+            for e in kwargs["key_auths"]:
+                pubkey = public_key(e[0], prefix)
+                keyAuths.append((bytes(pubkey), pubkey, e[1]))
+            keyAuths.sort(key=itemgetter(0))
+            accountAuths = sorted(kwargs["account_auths"], key=itemgetter(0))
 
             accountAuths = Map([
-                [String(e[0]), Uint16(e[1])]
-                for e in kwargs["account_auths"]
+                (account_name(name), Uint16(weight))
+                for name, weight in accountAuths
             ])
             keyAuths = Map([
-                [PublicKey(e[0], prefix=prefix), Uint16(e[1])]
-                for e in kwargs["key_auths"]
+                (pubkey, Uint16(weight))
+                for _, pubkey, weight in keyAuths
             ])
-            super().__init__(OrderedDict([
-                ('weight_threshold', Uint32(int(kwargs["weight_threshold"]))),
+            super().__init__(_fields([
+                ('weight_threshold', Uint32(kwargs["weight_threshold"])),
                 ('account_auths', accountAuths),
                 ('key_auths', keyAuths),
             ]))
@@ -103,75 +217,62 @@ class Memo(GrapheneObject):
             if len(args) == 1 and len(kwargs) == 0:
                 kwargs = args[0]
 
-            super().__init__(OrderedDict([
-                ('from', PublicKey(kwargs["from"], prefix=prefix)),
-                ('to', PublicKey(kwargs["to"], prefix=prefix)),
-                ('nonce', Uint64(int(kwargs["nonce"]))),
-                ('check', Uint32(int(kwargs["check"]))),
+            super().__init__(_fields([
+                ('from', public_key(kwargs["from"], prefix)),
+                ('to', public_key(kwargs["to"], prefix)),
+                ('nonce', Uint64(kwargs["nonce"])),
+                ('check', Uint32(kwargs["check"])),
                 ('encrypted', Bytes(kwargs["encrypted"])),
             ]))
 
 
 class Vote(GrapheneObject):
-    def __init__(self, *args, **kwargs):
-        if isArgsThisClass(self, args):
-            self.data = args[0].data
-        else:
-            if len(args) == 1 and len(kwargs) == 0:
-                kwargs = args[0]
-            super().__init__(OrderedDict([
-                ('voter', String(kwargs["voter"])),
-                ('author', String(kwargs["author"])),
-                ('permlink', String(kwargs["permlink"])),
-                ('weight', Int16(kwargs["weight"])),
-            ]))
+    @graphene_init
+    def __init__(self, kwargs):
+        super().__init__(_fields([
+            ('voter', account_name(kwargs["voter"])),
+            ('author', account_name(kwargs["author"])),
+            ('permlink', String(kwargs["permlink"])),
+            ('weight', Int16(kwargs["weight"])),
+        ]))
 
 
 class Comment(GrapheneObject):
-    def __init__(self, *args, **kwargs):
-        if isArgsThisClass(self, args):
-            self.data = args[0].data
-        else:
-            if len(args) == 1 and len(kwargs) == 0:
-                kwargs = args[0]
-            meta = ""
-            if "json_metadata" in kwargs and kwargs["json_metadata"]:
-                if (isinstance(kwargs["json_metadata"], dict) or
-                        isinstance(kwargs["json_metadata"], list)):
-                    meta = json.dumps(kwargs["json_metadata"])
-                else:
-                    meta = kwargs["json_metadata"]
-
-            super().__init__(OrderedDict([
-                ('parent_author', String(kwargs["parent_author"])),
-                ('parent_permlink', String(kwargs["parent_permlink"])),
-                ('author', String(kwargs["author"])),
-                ('permlink', String(kwargs["permlink"])),
-                ('title', String(kwargs["title"])),
-                ('body', String(kwargs["body"])),
-                ('json_metadata', String(meta)),
-            ]))
+    @graphene_init
+    def __init__(self, kwargs):
+        meta = json_metadata(kwargs)
+
+        super().__init__(_fields([
+            ('parent_author', account_name(kwargs["parent_author"])),
+            ('parent_permlink', String(kwargs["parent_permlink"])),
+            ('author', account_name(kwargs["author"])),
+            ('permlink', String(kwargs["permlink"])),
+            ('title', String(kwargs["title"])),
+            ('body', String(kwargs["body"])),
+            ('json_metadata', String(meta)),
+        ]))
 
 
 class Amount():
+    __slots__ = ("amount", "asset", "precision", "amount_int", "asset_bytes")
+
     def __init__(self, d):
-        self.amount, self.asset = d.strip().split(" ")
-        self.amount = float(self.amount)
+        amount, self.asset = d.strip().split(" ")
+        self.amount = float(amount)
 
-        if self.asset in asset_precision:
-            self.precision = asset_precision[self.asset]
-        else:
+        try:
+            self.precision, self.asset_bytes = asset_info[self.asset]
+        except KeyError:
             raise Exception("Asset unknown")
 
+        # Satoshi amount, parsed from the decimal string without going
+        # through binary floating point
+        self.amount_int = int(
+            Decimal(amount).scaleb(self.precision).to_integral_value())
+
     def __bytes__(self):
-        # padding
-        asset = self.asset + "\x00" * (7 - len(self.asset))
-        amount = round(float(self.amount) * 10 ** self.precision)
-        return (
-            struct.pack("<q", amount) +
-            struct.pack("<b", self.precision) +
-            bytes(asset, "ascii")
-        )
+        return amount_struct.pack(
+            self.amount_int, self.precision, self.asset_bytes)
 
     def __str__(self):
         return '{:.{}f} {}'.format(
@@ -182,50 +283,36 @@ class Amount():
 
 
 class Exchange_rate(GrapheneObject):
-    def __init__(self, *args, **kwargs):
-        if isArgsThisClass(self, args):
-            self.data = args[0].data
-        else:
-            if len(args) == 1 and len(kwargs) == 0:
-                kwargs = args[0]
-
-            super().__init__(OrderedDict([
-                ('base', Amount(kwargs["base"])),
-                ('quote', Amount(kwargs["quote"])),
-            ]))
+    @graphene_init
+    def __init__(self, kwargs):
+        super().__init__(_fields([
+            ('base', Amount(kwargs["base"])),
+            ('quote', Amount(kwargs["quote"])),
+        ]))
 
 
 class Witness_props(GrapheneObject):
-    def __init__(self, *args, **kwargs):
-        if isArgsThisClass(self, args):
-            self.data = args[0].data
-        else:
-            if len(args) == 1 and len(kwargs) == 0:
-                kwargs = args[0]
-
-            super().__init__(OrderedDict([
-                ('account_creation_fee', Amount(kwargs["account_creation_fee"])),
-                ('maximum_block_size', Uint32(kwargs["maximum_block_size"])),
-                ('sbd_interest_rate', Uint16(kwargs["sbd_interest_rate"])),
-            ]))
+    @graphene_init
+    def __init__(self, kwargs):
+        super().__init__(_fields([
+            ('account_creation_fee', Amount(kwargs["account_creation_fee"])),
+            ('maximum_block_size', Uint32(kwargs["maximum_block_size"])),
+            ('sbd_interest_rate', Uint16(kwargs["sbd_interest_rate"])),
+        ]))
 
 
 class Beneficiary(GrapheneObject):
-    def __init__(self, *args, **kwargs):
-        if isArgsThisClass(self, args):
-            self.data = args[0].data
-        else:
-            if len(args) == 1 and len(kwargs) == 0:
-                kwargs = args[0]
-            super().__init__(OrderedDict([
-                ('account', String(kwargs["account"])),
-                ('weight', Int16(kwargs["weight"])),
-            ]))
+    @graphene_init
+    def __init__(self, kwargs):
+        super().__init__(_fields([
+            ('account', account_name(kwargs["account"])),
+            ('weight', Int16(kwargs["weight"])),
+        ]))
 
 
 class Beneficiaries(GrapheneObject):
     def __init__(self, kwargs):
-        super().__init__(OrderedDict([
+        super().__init__(_fields([
             ('beneficiaries',
                 Array([Beneficiary(o) for o in kwargs["beneficiaries"]])),
         ]))
@@ -246,371 +333,293 @@ class CommentOptionExtensions(Static_variant):
 ########################################################
 
 class Account_create_with_delegation(GrapheneObject):
-    def __init__(self, *args, **kwargs):
-        if isArgsThisClass(self, args):
-            self.data = args[0].data
-        else:
-            if len(args) == 1 and len(kwargs) == 0:
-                kwargs = args[0]
-            prefix = kwargs.pop("prefix", default_prefix)
-
-            assert len(kwargs["new_account_name"]) <= 16, "Account name must be at most 16 chars long"
-
-            meta = ""
-            if "json_metadata" in kwargs and kwargs["json_metadata"]:
-                if isinstance(kwargs["json_metadata"], dict):
-                    meta = json.dumps(kwargs["json_metadata"])
-                else:
-                    meta = kwargs["json_metadata"]
-            # HF 18 requires liquid steem to be multiplied by 30 for creation
-            # f = Amount(kwargs["fee"])
-            # fee = '{} STEEM'.format(f.amount * 30)
-            # print(fee)
-            super().__init__(OrderedDict([
-                ('fee', Amount(kwargs['fee'])),
-                ('delegation', Amount(kwargs["delegation"])),
-                ('creator', String(kwargs["creator"])),
-                ('new_account_name', String(kwargs["new_account_name"])),
-                ('owner', Permission(kwargs["owner"], prefix=prefix)),
-                ('active', Permission(kwargs["active"], prefix=prefix)),
-                ('posting', Permission(kwargs["posting"], prefix=prefix)),
-                ('memo_key', PublicKey(kwargs["memo_key"], prefix=prefix)),
-                ('json_metadata', String(meta)),
-                ('extensions', Array([])),
-            ]))
+    @graphene_init
+    def __init__(self, kwargs):
+        prefix = kwargs.pop("prefix", default_prefix)
+
+        assert len(kwargs["new_account_name"]) <= 16, "Account name must be at most 16 chars long"
+
+        meta = json_metadata(kwargs)
+        # HF 18 requires liquid steem to be multiplied by 30 for creation
+        # f = Amount(kwargs["fee"])
+        # fee = '{} STEEM'.format(f.amount * 30)
+        # print(fee)
+        super().__init__(_fields([
+            ('fee', Amount(kwargs['fee'])),
+            ('delegation', Amount(kwargs["delegation"])),
+            ('creator', account_name(kwargs["creator"])),
+            ('new_account_name', String(kwargs["new_account_name"])),
+            ('owner', Permission(kwargs["owner"], prefix=prefix)),
+            ('active', Permission(kwargs["active"], prefix=prefix)),
+            ('posting', Permission(kwargs["posting"], prefix=prefix)),
+            ('memo_key', public_key(kwargs["memo_key"], prefix)),
+            ('json_metadata', String(meta)),
+            ('extensions', Array([])),
+        ]))
 
 
 class Account_create(GrapheneObject):
-    def __init__(self, *args, **kwargs):
-        if isArgsThisClass(self, args):
-            self.data = args[0].data
-        else:
-            if len(args) == 1 and len(kwargs) == 0:
-                kwargs = args[0]
-            prefix = kwargs.pop("prefix", default_prefix)
-
-            assert len(kwargs["new_account_name"]) <= 16, "Account name must be at most 16 chars long"
-
-            meta = ""
-            if "json_metadata" in kwargs and kwargs["json_metadata"]:
-                if isinstance(kwargs["json_metadata"], dict):
-                    meta = json.dumps(kwargs["json_metadata"])
-                else:
-                    meta = kwargs["json_metadata"]
-            super().__init__(OrderedDict([
-                ('fee', Amount(kwargs["fee"])),
-                ('creator', String(kwargs["creator"])),
-                ('new_account_name', String(kwargs["new_account_name"])),
-                ('owner', Permission(kwargs["owner"], prefix=prefix)),
-                ('active', Permission(kwargs["active"], prefix=prefix)),
-                ('posting', Permission(kwargs["posting"], prefix=prefix)),
-                ('memo_key', PublicKey(kwargs["memo_key"], prefix=prefix)),
-                ('json_metadata', String(meta)),
-            ]))
+    @graphene_init
+    def __init__(self, kwargs):
+        prefix = kwargs.pop("prefix", default_prefix)
+
+        assert len(kwargs["new_account_name"]) <= 16, "Account name must be at most 16 chars long"
+
+        meta = json_metadata(kwargs)
+        super().__init__(_fields([
+            ('fee', Amount(kwargs["fee"])),
+            ('creator', account_name(kwargs["creator"])),
+            ('new_account_name', String(kwargs["new_account_name"])),
+            ('owner', Permission(kwargs["owner"], prefix=prefix)),
+            ('active', Permission(kwargs["active"], prefix=prefix)),
+            ('posting', Permission(kwargs["posting"], prefix=prefix)),
+            ('memo_key', public_key(kwargs["memo_key"], prefix)),
+            ('json_metadata', String(meta)),
+        ]))
 
 
 class Account_update(GrapheneObject):
-    def __init__(self, *args, **kwargs):
-        if isArgsThisClass(self, args):
-            self.data = args[0].data
-        else:
-            if len(args) == 1 and len(kwargs) == 0:
-                kwargs = args[0]
-            prefix = kwargs.pop("prefix", default_prefix)
+    @graphene_init
+    def __init__(self, kwargs):
+        prefix = kwargs.pop("prefix", default_prefix)
 
-            meta = ""
-            if "json_metadata" in kwargs and kwargs["json_metadata"]:
-                if isinstance(kwargs["json_metadata"], dict):
-                    meta = json.dumps(kwargs["json_metadata"])
-                else:
-                    meta = kwargs["json_metadata"]
-
-            owner = Permission(kwargs["owner"], prefix=prefix) if "owner" in kwargs else None
-            active = Permission(kwargs["active"], prefix=prefix) if "active" in kwargs else None
-            posting = Permission(kwargs["posting"], prefix=prefix) if "posting" in kwargs else None
-
-            super().__init__(OrderedDict([
-                ('account', String(kwargs["account"])),
-                ('owner', Optional(owner)),
-                ('active', Optional(active)),
-                ('posting', Optional(posting)),
-                ('memo_key', PublicKey(kwargs["memo_key"], prefix=prefix)),
-                ('json_metadata', String(meta)),
-            ]))
+        meta = json_metadata(kwargs)
+
+        # Unchanged permissions share the empty ``Optional``
+        owner = kwargs.get("owner")
+        active = kwargs.get("active")
+        posting = kwargs.get("posting")
+        if owner is None:
+            owner = optional_none
+        else:
+            owner = Optional(Permission(owner, prefix=prefix))
+        if active is None:
+            active = optional_none
+        else:
+            active = Optional(Permission(active, prefix=prefix))
+        if posting is None:
+            posting = optional_none
+        else:
+            posting = Optional(Permission(posting, prefix=prefix))
+
+        super().__init__(_fields([
+            ('account', account_name(kwargs["account"])),
+            ('owner', owner),
+            ('active', active),
+            ('posting', posting),
+            ('memo_key', public_key(kwargs["memo_key"], prefix)),
+            ('json_metadata', String(meta)),
+        ]))
 
 
 class Transfer(GrapheneObject):
-    def __init__(self, *args, **kwargs):
-        if isArgsThisClass(self, args):
-            self.data = args[0].data
-        else:
-            if len(args) == 1 and len(kwargs) == 0:
-                kwargs = args[0]
-            if "memo" not in kwargs:
-                kwargs["memo"] = ""
-            super().__init__(OrderedDict([
-                ('from', String(kwargs["from"])),
-                ('to', String(kwargs["to"])),
-                ('amount', Amount(kwargs["amount"])),
-                ('memo', String(kwargs["memo"])),
-            ]))
+    @graphene_init
+    def __init__(self, kwargs):
+        super().__init__(_fields([
+            ('from', account_name(kwargs["from"])),
+            ('to', account_name(kwargs["to"])),
+            ('amount', Amount(kwargs["amount"])),
+            ('memo', transfer_memo(kwargs)),
+        ]))
 
 
 class Transfer_to_vesting(GrapheneObject):
-    def __init__(self, *args, **kwargs):
-        if isArgsThisClass(self, args):
-            self.data = args[0].data
-        else:
-            if len(args) == 1 and len(kwargs) == 0:
-                kwargs = args[0]
-            super().__init__(OrderedDict([
-                ('from', String(kwargs["from"])),
-                ('to', String(kwargs["to"])),
-                ('amount', Amount(kwargs["amount"])),
-            ]))
+    @graphene_init
+    def __init__(self, kwargs):
+        super().__init__(_fields([
+            ('from', account_name(kwargs["from"])),
+            ('to', account_name(kwargs["to"])),
+            ('amount', Amount(kwargs["amount"])),
+        ]))
 
 
 class Withdraw_vesting(GrapheneObject):
-    def __init__(self, *args, **kwargs):
-        if isArgsThisClass(self, args):
-            self.data = args[0].data
-        else:
-            if len(args) == 1 and len(kwargs) == 0:
-                kwargs = args[0]
-            super().__init__(OrderedDict([
-                ('account', String(kwargs["account"])),
-                ('vesting_shares', Amount(kwargs["vesting_shares"])),
-            ]))
+    @graphene_init
+    def __init__(self, kwargs):
+        super().__init__(_fields([
+            ('account', account_name(kwargs["account"])),
+            ('vesting_shares', Amount(kwargs["vesting_shares"])),
+        ]))
 
 
 class Limit_order_create(GrapheneObject):
-    def __init__(self, *args, **kwargs):
-        if isArgsThisClass(self, args):
-            self.data = args[0].data
-        else:
-            if len(args) == 1 and len(kwargs) == 0:
-                kwargs = args[0]
-            super().__init__(OrderedDict([
-                ('owner', String(kwargs["owner"])),
-                ('orderid', Uint32(int(kwargs["orderid"]))),
-                ('amount_to_sell', Amount(kwargs["amount_to_sell"])),
-                ('min_to_receive', Amount(kwargs["min_to_receive"])),
-                ('fill_or_kill', Bool(kwargs["fill_or_kill"])),
-                ('expiration', PointInTime(kwargs["expiration"])),
-            ]))
+    @graphene_init
+    def __init__(self, kwargs):
+        super().__init__(_fields([
+            ('owner', account_name(kwargs["owner"])),
+            ('orderid', Uint32(kwargs["orderid"])),
+            ('amount_to_sell', Amount(kwargs["amount_to_sell"])),
+            ('min_to_receive', Amount(kwargs["min_to_receive"])),
+            ('fill_or_kill', Bool(kwargs["fill_or_kill"])),
+            ('expiration', PointInTime(kwargs["expiration"])),
+        ]))
 
 
 class Limit_order_cancel(GrapheneObject):
-    def __init__(self, *args, **kwargs):
-        if isArgsThisClass(self, args):
-            self.data = args[0].data
-        else:
-            if len(args) == 1 and len(kwargs) == 0:
-                kwargs = args[0]
-            super().__init__(OrderedDict([
-                ('owner', String(kwargs["owner"])),
-                ('orderid', Uint32(int(kwargs["orderid"]))),
-            ]))
+    @graphene_init
+    def __init__(self, kwargs):
+        super().__init__(_fields([
+            ('owner', account_name(kwargs["owner"])),
+            ('orderid', Uint32(kwargs["orderid"])),
+        ]))
 
 
 class Set_withdraw_vesting_route(GrapheneObject):
-    def __init__(self, *args, **kwargs):
-        if isArgsThisClass(self, args):
-            self.data = args[0].data
-        else:
-            if len(args) == 1 and len(kwargs) == 0:
-                kwargs = args[0]
-            super().__init__(OrderedDict([
-                ('from_account', String(kwargs["from_account"])),
-                ('to_account', String(kwargs["to_account"])),
-                ('percent', Uint16((kwargs["percent"]))),
-                ('auto_vest', Bool(kwargs["auto_vest"])),
-            ]))
+    @graphene_init
+    def __init__(self, kwargs):
+        super().__init__(_fields([
+            ('from_account', account_name(kwargs["from_account"])),
+            ('to_account', account_name(kwargs["to_account"])),
+            ('percent', Uint16(kwargs["percent"])),
+            ('auto_vest', Bool(kwargs["auto_vest"])),
+        ]))
 
 
 class Convert(GrapheneObject):
-    def __init__(self, *args, **kwargs):
-        if isArgsThisClass(self, args):
-            self.data = args[0].data
-        else:
-            if len(args) == 1 and len(kwargs) == 0:
-                kwargs = args[0]
-            super().__init__(OrderedDict([
-                ('owner', String(kwargs["owner"])),
-                ('requestid', Uint32(kwargs["requestid"])),
-                ('amount', Amount(kwargs["amount"])),
-            ]))
+    @graphene_init
+    def __init__(self, kwargs):
+        super().__init__(_fields([
+            ('owner', account_name(kwargs["owner"])),
+            ('requestid', Uint32(kwargs["requestid"])),
+            ('amount', Amount(kwargs["amount"])),
+        ]))
 
 
 class Feed_publish(GrapheneObject):
-    def __init__(self, *args, **kwargs):
-        if isArgsThisClass(self, args):
-            self.data = args[0].data
-        else:
-            if len(args) == 1 and len(kwargs) == 0:
-                kwargs = args[0]
-            super().__init__(OrderedDict([
-                ('publisher', String(kwargs["publisher"])),
-                ('exchange_rate', Exchange_rate(kwargs["exchange_rate"])),
-            ]))
+    @graphene_init
+    def __init__(self, kwargs):
+        super().__init__(_fields([
+            ('publisher', account_name(kwargs["publisher"])),
+            ('exchange_rate', Exchange_rate(kwargs["exchange_rate"])),
+        ]))
 
 
 class Witness_update(GrapheneObject):
-    def __init__(self, *args, **kwargs):
-        if isArgsThisClass(self, args):
-            self.data = args[0].data
-        else:
-            if len(args) == 1 and len(kwargs) == 0:
-                kwargs = args[0]
-            prefix = kwargs.pop("prefix", default_prefix)
-
-            if not kwargs["block_signing_key"]:
-                kwargs["block_signing_key"] = "STM1111111111111111111111111111111114T1Anm"
-            super().__init__(OrderedDict([
-                ('owner', String(kwargs["owner"])),
-                ('url', String(kwargs["url"])),
-                ('block_signing_key', PublicKey(kwargs["block_signing_key"], prefix=prefix)),
-                ('props', Witness_props(kwargs["props"])),
-                ('fee', Amount(kwargs["fee"])),
-            ]))
+    @graphene_init
+    def __init__(self, kwargs):
+        prefix = kwargs.pop("prefix", default_prefix)
+
+        if not kwargs["block_signing_key"]:
+            kwargs["block_signing_key"] = "STM1111111111111111111111111111111114T1Anm"
+        super().__init__(_fields([
+            ('owner', account_name(kwargs["owner"])),
+            ('url', String(kwargs["url"])),
+            ('block_signing_key', public_key(kwargs["block_signing_key"], prefix)),
+            ('props', Witness_props(kwargs["props"])),
+            ('fee', Amount(kwargs["fee"])),
+        ]))
 
 
 class Transfer_to_savings(GrapheneObject):
-    def __init__(self, *args, **kwargs):
-        if isArgsThisClass(self, args):
-            self.data = args[0].data
-        else:
-            if len(args) == 1 and len(kwargs) == 0:
-                kwargs = args[0]
-            if "memo" not in kwargs:
-                kwargs["memo"] = ""
-            super().__init__(OrderedDict([
-                ('from', String(kwargs["from"])),
-                ('to', String(kwargs["to"])),
-                ('amount', Amount(kwargs["amount"])),
-                ('memo', String(kwargs["memo"])),
-            ]))
+    @graphene_init
+    def __init__(self, kwargs):
+        super().__init__(_fields([
+            ('from', account_name(kwargs["from"])),
+            ('to', account_name(kwargs["to"])),
+            ('amount', Amount(kwargs["amount"])),
+            ('memo', transfer_memo(kwargs)),
+        ]))
 
 
 class Transfer_from_savings(GrapheneObject):
-    def __init__(self, *args, **kwargs):
-        if isArgsThisClass(self, args):
-            self.data = args[0].data
-        else:
-            if len(args) == 1 and len(kwargs) == 0:
-                kwargs = args[0]
-            if "memo" not in kwargs:
-                kwargs["memo"] = ""
-
-            super().__init__(OrderedDict([
-                ('from', String(kwargs["from"])),
-                ('request_id', Uint32(int(kwargs["request_id"]))),
-                ('to', String(kwargs["to"])),
-                ('amount', Amount(kwargs["amount"])),
-                ('memo', String(kwargs["memo"])),
-            ]))
+    @graphene_init
+    def __init__(self, kwargs):
+        super().__init__(_fields([
+            ('from', account_name(kwargs["from"])),
+            ('request_id', Uint32(kwargs["request_id"])),
+            ('to', account_name(kwargs["to"])),
+            ('amount', Amount(kwargs["amount"])),
+            ('memo', transfer_memo(kwargs)),
+        ]))
 
 
 class Cancel_transfer_from_savings(GrapheneObject):
-    def __init__(self, *args, **kwargs):
-        if isArgsThisClass(self, args):
-            self.data = args[0].data
-        else:
-            if len(args) == 1 and len(kwargs) == 0:
-                kwargs = args[0]
-            super().__init__(OrderedDict([
-                ('from', String(kwargs["from"])),
-                ('request_id', Uint32(int(kwargs["request_id"]))),
-            ]))
+    @graphene_init
+    def __init__(self, kwargs):
+        super().__init__(_fields([
+            ('from', account_name(kwargs["from"])),
+            ('request_id', Uint32(kwargs["request_id"])),
+        ]))
 
 
 class Account_witness_vote(GrapheneObject):
-    def __init__(self, *args, **kwargs):
-        if isArgsThisClass(self, args):
-            self.data = args[0].data
-        else:
-            if len(args) == 1 and len(kwargs) == 0:
-                kwargs = args[0]
-            super().__init__(OrderedDict([
-                ('account', String(kwargs["account"])),
-                ('witness', String(kwargs["witness"])),
-                ('approve', Bool(bool(kwargs["approve"]))),
-            ]))
+    @graphene_init
+    def __init__(self, kwargs):
+        super().__init__(_fields([
+            ('account', account_name(kwargs["account"])),
+            ('witness', account_name(kwargs["witness"])),
+            ('approve', Bool(bool(kwargs["approve"]))),
+        ]))
 
 
 class Custom_json(GrapheneObject):
-    def __init__(self, *args, **kwargs):
-        if isArgsThisClass(self, args):
-            self.data = args[0].data
-        else:
-            if len(args) == 1 and len(kwargs) == 0:
-                kwargs = args[0]
-            if "json" in kwargs and kwargs["json"]:
-                if (isinstance(kwargs["json"], dict) or
-                        isinstance(kwargs["json"], list)):
-                    js = json.dumps(kwargs["json"])
-                else:
-                    js = kwargs["json"]
-
-            if len(kwargs["id"]) > 32:
-                raise Exception("'id' too long")
-
-            super().__init__(OrderedDict([
-                ('required_auths',
-                    Array([String(o) for o in kwargs["required_auths"]])),
-                ('required_posting_auths',
-                    Array([String(o) for o in kwargs["required_posting_auths"]])),
-                ('id', String(kwargs["id"])),
-                ('json', String(js)),
-            ]))
+    @graphene_init
+    def __init__(self, kwargs):
+        js = kwargs.get("json") or ""
+        if isinstance(js, (dict, list)):
+            js = json.dumps(js)
+
+        if len(kwargs["id"]) > 32:
+            raise Exception("'id' too long")
+
+        super().__init__(_fields([
+            ('required_auths',
+                Array([account_name(o) for o in kwargs["required_auths"]])),
+            ('required_posting_auths',
+                Array([account_name(o) for o in kwargs["required_posting_auths"]])),
+            ('id', String(kwargs["id"])),
+            ('json', String(js)),
+        ]))
 
 
 class Comment_options(GrapheneObject):
-    def __init__(self, *args, **kwargs):
-        if isArgsThisClass(self, args):
-            self.data = args[0].data
+    @graphene_init
+    def __init__(self, kwargs):
+        if kwargs.get("extensions"):
+            extensions = Array([CommentOptionExtensions(o) for o in kwargs["extensions"]])
         else:
-            if len(args) == 1 and len(kwargs) == 0:
-                kwargs = args[0]
-            if "extensions" in kwargs and kwargs["extensions"]:
-                extensions = Array([CommentOptionExtensions(o) for o in kwargs["extensions"]])
-            else:
-                extensions = Array([])
-            super().__init__(OrderedDict([
-                ('author', String(kwargs["author"])),
-                ('permlink', String(kwargs["permlink"])),
-                ('max_accepted_payout', Amount(kwargs["max_accepted_payout"])),
-                ('percent_steem_dollars', Uint16(int(kwargs["percent_steem_dollars"]))),
-                ('allow_votes', Bool(bool(kwargs["allow_votes"]))),
-                ('allow_curation_rewards', Bool(bool(kwargs["allow_curation_rewards"]))),
-                ('extensions', extensions),
-            ]))
+            extensions = Array([])
+        super().__init__(_fields([
+            ('author', account_name(kwargs["author"])),
+            ('permlink', String(kwargs["permlink"])),
+            ('max_accepted_payout', Amount(kwargs["max_accepted_payout"])),
+            ('percent_steem_dollars', Uint16(kwargs["percent_steem_dollars"])),
+            ('allow_votes', Bool(bool(kwargs["allow_votes"]))),
+            ('allow_curation_rewards', Bool(bool(kwargs["allow_curation_rewards"]))),
+            ('extensions', extensions),
+        ]))
 
 
 class Claim_reward_balance(GrapheneObject):
-    def __init__(self, *args, **kwargs):
-        if isArgsThisClass(self, args):
-            self.data = args[0].data
-        else:
-            if len(args) == 1 and len(kwargs) == 0:
-                kwargs = args[0]
-            super().__init__(OrderedDict([
-                ('account', String(kwargs["account"])),
-                ('reward_steem', Amount(kwargs["reward_steem"])),
-                ('reward_sbd', Amount(kwargs["reward_sbd"])),
-                ('reward_vests', Amount(kwargs["reward_vests"])),
-            ]))
+    @graphene_init
+    def __init__(self, kwargs):
+        super().__init__(_fields([
+            ('account', account_name(kwargs["account"])),
+            ('reward_steem', Amount(kwargs["reward_steem"])),
+            ('reward_sbd', Amount(kwargs["reward_sbd"])),
+            ('reward_vests', Amount(kwargs["reward_vests"])),
+        ]))
 
 
 class Delegate_vesting_shares(GrapheneObject):
-    def __init__(self, *args, **kwargs):
-        if isArgsThisClass(self, args):
-            self.data = args[0].data
-        else:
-            if len(args) == 1 and len(kwargs) == 0:
-                kwargs = args[0]
-            super().__init__(OrderedDict([
-                ('delegator', String(kwargs["delegator"])),
-                ('delegatee', String(kwargs["delegatee"])),
-                ('vesting_shares', Amount(kwargs["vesting_shares"])),
-            ]))
+    @graphene_init
+    def __init__(self, kwargs):
+        super().__init__(_fields([
+            ('delegator', account_name(kwargs["delegator"])),
+            ('delegatee', account_name(kwargs["delegatee"])),
+            ('vesting_shares', Amount(kwargs["vesting_shares"])),
+        ]))
+
+
+#: Serialized operation ids, used by ``Operation``
+operation_id_bytes = {
+    opId: bytes(Id(opId))
+    for opId in operations.values()
+}
+
+#: Operation classes by operation name, used by ``Operation``
+operation_klasses = {
+    name: globals()[name[0].upper() + name[1:]]
+    for name in operations
+    if name[0].upper() + name[1:] in globals()
+}
@@ -1,6 +1,11 @@
+from binascii import hexlify
 from graphenebase.signedtransactions import Signed_Transaction as GrapheneSigned_Transaction
+from graphenebase.account import PublicKey
+from graphenebase.types import Array, Signature
 from .operations import Operation
+from .ecdsa import sign_message, verify_message
 from .chains import known_chains
+from .exceptions import MissingSignatureForKey
 import logging
 log = logging.getLogger(__name__)
 
@@ -18,10 +23,55 @@ class Signed_Transaction(GrapheneSigned_Transaction):
         super(Signed_Transaction, self).__init__(*args, **kwargs)
 
     def sign(self, wifkeys, chain="STEEM"):
-        return super(Signed_Transaction, self).sign(wifkeys, chain)
+        """ Sign the transaction with the provided private keys.
+
+            :param array wifkeys: Array of wif keys (or ``PrivateKey``)
+            :param str chain: identifier for the chain
+
+        """
+        self.deriveDigest(chain)
+
+        # Get Unique private keys, compared by their WIF as the same key
+        # may be given as WIF and as ``PrivateKey``
+        self.privkeys = []
+        unique = set()
+        for wif in wifkeys:
+            if str(wif) not in unique:
+                unique.add(str(wif))
+                self.privkeys.append(wif)
+
+        # Sign the message with every private key given!
+        sigs = [Signature(sign_message(self.message, wif))
+                for wif in self.privkeys]
+
+        self.data["signatures"] = Array(sigs)
+        return self
 
     def verify(self, pubkeys=[], chain="STEEM"):
-        return super(Signed_Transaction, self).verify(pubkeys, chain)
+        """ Verify the signatures of the transaction and make sure all
+            given public keys have signed it.
+
+            :param array pubkeys: Array of ``PublicKey``
+            :param str chain: identifier for the chain
+            :return: hex representations of the keys that signed
+        """
+        chain_params = self.getChainParams(chain)
+        self.deriveDigest(chain)
+
+        pubKeysFound = [
+            hexlify(verify_message(self.message, bytes(signature))).decode("ascii")
+            for signature in self.data["signatures"].data
+        ]
+
+        for pubkey in pubkeys:
+            if not isinstance(pubkey, PublicKey):
+                raise Exception("Pubkeys must be array of 'PublicKey'")
+            # Like graphenebase, also accept the uncompressed key
+            k = pubkey.unCompressed()[2:]
+            if k not in pubKeysFound and repr(pubkey) not in pubKeysFound:
+                f = format(pubkey, chain_params["prefix"])
+                raise MissingSignatureForKey("Signature for %s missing!" % f)
+        return pubKeysFound
 
     def getOperationKlass(self):
         return Operation
@@ -12,11 +12,14 @@ from .signedtransactions import Signed_Transaction as GrapheneSigned_Transaction
 # Import all operations so they can be loaded from this module
 from .operations import (
     Operation, Permission, Memo, Vote, Comment, Amount,
-    Exchange_rate, Witness_props, Account_create, Account_update,
+    Exchange_rate, Witness_props, Beneficiary, Beneficiaries,
+    CommentOptionExtensions, Account_create_with_delegation,
+    Account_create, Account_update,
     Transfer, Transfer_to_vesting, Withdraw_vesting, Limit_order_create,
     Limit_order_cancel, Set_withdraw_vesting_route, Convert, Feed_publish,
     Witness_update, Transfer_to_savings, Transfer_from_savings,
     Cancel_transfer_from_savings, Account_witness_vote, Custom_json,
+    Comment_options, Claim_reward_balance, Delegate_vesting_shares,
 )
 from .chains import known_chains
 
@@ -46,6 +46,10 @@ setup(
         # "python-dateutil",
         # "secp256k1==0.13.2"
     ],
+    extras_require={
+        "orjson": ["orjson"],
+        "coincurve": ["coincurve"],
+    },
     setup_requires=['pytest-runner'],
     tests_require=['pytest'],
     include_package_data=True,
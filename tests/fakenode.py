@@ -0,0 +1,158 @@
+""" A minimal websocket server that answers JSON-RPC calls like a steem
+    node. Used to test the RPC layer without network access.
+"""
+import base64
+import hashlib
+import json
+import socket
+import struct
+import threading
+
+GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+
+class FakeNode(object):
+    """ Serves ``self.methods`` (name -> callable) on ``self.url``
+
+        ``handle`` may be replaced to answer requests differently; if it
+        returns ``None``, the request is not answered at all.
+    """
+    def __init__(self):
+        self.methods = {
+            "login": lambda user, password: True,
+            "get_api_by_name": lambda name: {
+                "database_api": 2,
+                "network_broadcast_api": 3,
+            }.get(name),
+            "get_dynamic_global_properties": lambda: {
+                "current_supply": "1000.000 STEEM",
+                "head_block_number": 10,
+                "last_irreversible_block_num": 10,
+            },
+            "get_block": lambda num: {"previous": num - 1},
+        }
+        self.requests = []
+        self.connections = []
+        self.lock = threading.Lock()
+        self.listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.listener.bind(("127.0.0.1", 0))
+        self.listener.listen(16)
+        self.url = "ws://127.0.0.1:%d" % self.listener.getsockname()[1]
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def close(self):
+        """ Stop listening and drop all connections """
+        self.listener.close()
+        self.drop()
+
+    def drop(self, connections=None):
+        """ Drop the given (default: all) open connections, e.g. on a
+            node restart
+        """
+        with self.lock:
+            if connections is None:
+                connections = self.connections
+            self.connections = [
+                c for c in self.connections if c not in connections]
+        for conn in connections:
+            try:
+                conn.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            conn.close()
+
+    def call(self, request):
+        """ Answer a single JSON-RPC call """
+        _, method, args = request["params"]
+        try:
+            result = self.methods[method](*args)
+        except Exception as e:
+            return {"id": request["id"], "jsonrpc": "2.0",
+                    "error": {"message": "%s: %s" % (method, e)}}
+        return {"id": request["id"], "jsonrpc": "2.0", "result": result}
+
+    def handle(self, request):
+        if isinstance(request, list):
+            return [self.call(r) for r in request]
+        return self.call(request)
+
+    def _accept(self):
+        while True:
+            try:
+                conn, _ = self.listener.accept()
+            except OSError:
+                return
+            with self.lock:
+                self.connections.append(conn)
+            threading.Thread(
+                target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn):
+        try:
+            self._handshake(conn)
+            while True:
+                opcode, payload = self._read_frame(conn)
+                if opcode == 0x8:
+                    return
+                elif opcode == 0x9:
+                    self._send_frame(conn, 0xA, payload)
+                elif opcode == 0x1:
+                    request = json.loads(payload.decode("utf8"))
+                    with self.lock:
+                        self.requests.append(request)
+                    reply = self.handle(request)
+                    if reply is not None:
+                        self._send_frame(
+                            conn, 0x1, json.dumps(reply).encode("utf8"))
+        except (OSError, ConnectionError):
+            pass
+        finally:
+            conn.close()
+
+    def _recv_exactly(self, conn, n):
+        data = b""
+        while len(data) < n:
+            chunk = conn.recv(n - len(data))
+            if not chunk:
+                raise ConnectionError("connection closed")
+            data += chunk
+        return data
+
+    def _handshake(self, conn):
+        request = b""
+        while b"\r\n\r\n" not in request:
+            chunk = conn.recv(4096)
+            if not chunk:
+                raise ConnectionError("connection closed")
+            request += chunk
+        for line in request.decode("ascii").split("\r\n"):
+            if line.lower().startswith("sec-websocket-key:"):
+                key = line.split(":", 1)[1].strip().encode("ascii")
+        accept = base64.b64encode(hashlib.sha1(key + GUID).digest())
+        conn.sendall(
+            b"HTTP/1.1 101 Switching Protocols\r\n"
+            b"Upgrade: websocket\r\n"
+            b"Connection: Upgrade\r\n"
+            b"Sec-WebSocket-Accept: " + accept + b"\r\n\r\n")
+
+    def _read_frame(self, conn):
+        b0, b1 = self._recv_exactly(conn, 2)
+        length = b1 & 0x7f
+        if length == 126:
+            length, = struct.unpack("!H", self._recv_exactly(conn, 2))
+        elif length == 127:
+            length, = struct.unpack("!Q", self._recv_exactly(conn, 8))
+        mask = self._recv_exactly(conn, 4) if b1 & 0x80 else b"\x00" * 4
+        payload = self._recv_exactly(conn, length)
+        payload = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+        return b0 & 0x0f, payload
+
+    def _send_frame(self, conn, opcode, payload):
+        header = bytes([0x80 | opcode])
+        if len(payload) < 126:
+            header += bytes([len(payload)])
+        elif len(payload) < 2 ** 16:
+            header += bytes([126]) + struct.pack("!H", len(payload))
+        else:
+            header += bytes([127]) + struct.pack("!Q", len(payload))
+        conn.sendall(header + payload)
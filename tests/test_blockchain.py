@@ -0,0 +1,51 @@
+import threading
+import unittest
+from unittest import mock
+from piston.blockchain import Blockchain
+
+
+def blockchain(head_block=3):
+    steem = mock.Mock()
+    steem.rpc.get_config.return_value = {"STEEMIT_BLOCK_INTERVAL": 3}
+    steem.rpc.get_dynamic_global_properties.return_value = {
+        "last_irreversible_block_num": head_block}
+    steem.rpc.get_block.side_effect = lambda num: {
+        "previous": num - 1, "transactions": []}
+    steem.rpc.get_irreversible_block.side_effect = (
+        steem.rpc.get_block.side_effect)
+    return Blockchain(steem_instance=steem)
+
+
+class Testcases(unittest.TestCase):
+
+    def test_stop_between_blocks(self):
+        chain = blockchain()
+        blocks = chain.blocks(start=1)
+        self.assertEqual(next(blocks)["block_num"], 1)
+        chain.stop()
+        self.assertEqual(list(blocks), [])
+
+    def test_stop_while_waiting(self):
+        chain = blockchain()
+        threading.Timer(0.1, chain.stop).start()
+        # would otherwise wait 3 seconds for the next block
+        nums = [b["block_num"] for b in chain.blocks(start=1)]
+        self.assertEqual(nums, [1, 2, 3])
+
+    def test_restart_after_stop(self):
+        chain = blockchain()
+        chain.stop()
+        nums = [b["block_num"] for b in chain.blocks(start=1, stop=2)]
+        self.assertEqual(nums, [1, 2])
+
+    def test_cache_only_bounded_ranges(self):
+        chain = blockchain()
+        list(chain.blocks(start=1, stop=3))
+        self.assertEqual(chain.steem.rpc.get_irreversible_block.call_count, 3)
+        self.assertEqual(chain.steem.rpc.get_block.call_count, 0)
+        blocks = chain.blocks(start=1)
+        next(blocks)
+        chain.stop()
+        list(blocks)
+        self.assertEqual(chain.steem.rpc.get_irreversible_block.call_count, 3)
+        self.assertEqual(chain.steem.rpc.get_block.call_count, 1)
@@ -0,0 +1,70 @@
+import importlib
+import unittest
+from unittest import mock
+from pistonbase import ecdsa
+from pistonbase import operations
+from pistonbase.account import PrivateKey
+from pistonbase.exceptions import MissingSignatureForKey
+from pistonbase.transactions import Signed_Transaction
+
+wif = "5KQwrPbwdL6PhXujxW37FSSQZ1JiwsST4cqQzDeyXtP79zkvFD3"
+privkey = PrivateKey(wif)
+message = "Hello World"
+
+try:
+    import coincurve
+except ImportError:
+    coincurve = None
+
+
+def backend(use_coincurve):
+    return mock.patch.object(ecdsa, "USE_COINCURVE", use_coincurve)
+
+
+@unittest.skipIf(not ecdsa.USE_COINCURVE, "coincurve not usable")
+class Testcases(unittest.TestCase):
+
+    def test_sign(self):
+        for signer in (True, False):
+            for key in (wif, privkey):
+                with backend(signer):
+                    signature = ecdsa.sign_message(message, key)
+                self.assertEqual(len(signature), 65)
+                self.assertTrue(ecdsa.is_canonical(signature[1:]))
+                for verifier in (True, False):
+                    with backend(verifier):
+                        self.assertEqual(
+                            ecdsa.verify_message(message, signature),
+                            bytes(privkey.pubkey))
+
+    def test_verify_transaction(self):
+        tx = Signed_Transaction(
+            ref_block_num=34294,
+            ref_block_prefix=3707022213,
+            expiration="2016-04-06T08:29:27",
+            operations=[operations.Operation(operations.Vote(
+                **{"voter": "foobara",
+                   "author": "foobarc",
+                   "permlink": "foobard",
+                   "weight": 1000}))]
+        )
+        tx.sign([wif])
+        other = PrivateKey(
+            "5JWcdkhL3w4RkVPcZMdJsjos22yB5cSkPExerktvKnRNZR5gx1S").pubkey
+        for use_coincurve in (True, False):
+            with backend(use_coincurve):
+                self.assertEqual(
+                    tx.verify([privkey.pubkey]), [repr(privkey.pubkey)])
+                with self.assertRaises(MissingSignatureForKey):
+                    tx.verify([privkey.pubkey, other])
+
+    def test_unusable_coincurve(self):
+        with mock.patch.object(
+                coincurve.PrivateKey, "sign_recoverable",
+                side_effect=TypeError("unexpected keyword 'custom_nonce'")):
+            importlib.reload(ecdsa)
+        try:
+            self.assertFalse(ecdsa.USE_COINCURVE)
+        finally:
+            importlib.reload(ecdsa)
+        self.assertTrue(ecdsa.USE_COINCURVE)
@@ -33,3 +33,28 @@ class Testcases(unittest.TestCase):
                 memo
             )
             self.assertEqual(msg, plain)
+
+    def test_corrupt_memo(self):
+        from_priv = "5KNK3bejeP3PtQ1Q9EagBmGacYFCZ3qigRAZDbfqcdjDWWmZSMm"
+        to_priv = "5K2JRPe1iRwD2He5DyDRtHs3Z1wpom3YXguFxEd57kNTHhQuZ2k"
+        memo = Memo.encode_memo(
+            PrivateKey(from_priv),
+            PrivateKey(to_priv).pubkey,
+            "16332877645293003478",
+            "just a donation"
+        )
+        raw = Memo.base58decode(memo[1:])
+        # public keys, nonce and checksum take the first 156 characters,
+        # followed by the varint length and the cipher text
+        header, cipher = raw[:156], raw[158:]
+        for corrupt in [
+            # nothing to unpad
+            header + "00",
+            # last block garbled
+            header + raw[156:158] + cipher[:-2] + "%02x" % (int(cipher[-2:], 16) ^ 0xff),
+        ]:
+            with self.assertRaises(ValueError):
+                Memo.decode_memo(
+                    PrivateKey(to_priv),
+                    "#" + Memo.base58encode(corrupt)
+                )
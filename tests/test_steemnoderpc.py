@@ -0,0 +1,261 @@
+import itertools
+import json
+import threading
+import time
+import unittest
+import websocket
+from unittest import mock
+from pistonapi import steemnoderpc
+from pistonapi.steemnoderpc import SteemNodeRPC, _dumps, _loads
+from grapheneapi.graphenewsrpc import NumRetriesReached
+from pistonapi.exceptions import NoAccessApi, RPCError
+from fakenode import FakeNode
+
+payload = {
+    "method": "call",
+    "params": [0, "get_block", [1]],
+    "jsonrpc": "2.0",
+    "id": 1,
+    "memo": "Grüße",
+}
+
+
+def wait_for(condition, timeout=5):
+    end = time.time() + timeout
+    while not condition():
+        if time.time() > end:
+            raise AssertionError("Timed out")
+        time.sleep(0.01)
+
+
+class CodecTestcases(unittest.TestCase):
+
+    def test_roundtrip_fallback(self):
+        with mock.patch.object(steemnoderpc, "orjson", None):
+            self.assertEqual(_loads(_dumps(payload)), payload)
+            self.assertEqual(_loads(_dumps([payload])), [payload])
+
+    @unittest.skipIf(steemnoderpc.orjson is None, "orjson not installed")
+    def test_roundtrip_orjson(self):
+        encoded = _dumps(payload)
+        self.assertEqual(json.loads(encoded.decode("utf8")), payload)
+        self.assertEqual(_loads(encoded), payload)
+
+    def test_big_int(self):
+        # orjson refuses integers above 64 bit
+        big = {"id": 1, "result": 2 ** 70}
+        self.assertEqual(_dumps(big), b'{"id": 1, "result": 1180591620717411303424}')
+        self.assertEqual(_loads(_dumps(big)), big)
+
+    def test_control_characters(self):
+        # orjson (and strict json) refuse raw control characters
+        self.assertEqual(_loads('{"result": "a\nb"}'), {"result": "a\nb"})
+        with mock.patch.object(steemnoderpc, "orjson", None):
+            self.assertEqual(_loads('{"result": "a\nb"}'), {"result": "a\nb"})
+
+
+class SpareTestcases(unittest.TestCase):
+
+    def setUp(self):
+        self.nodes = [FakeNode(), FakeNode()]
+        self.rpc = SteemNodeRPC(
+            [n.url for n in self.nodes],
+            spare_connections=1, num_retries=3, timeout=2)
+        wait_for(lambda: self.rpc._spares.qsize() == 1)
+
+    def tearDown(self):
+        for node in self.nodes:
+            node.close()
+
+    def test_spares_do_not_advance_urls(self):
+        self.assertEqual(self.rpc.url, self.nodes[0].url)
+        self.assertEqual(next(self.rpc.urls), self.nodes[1].url)
+
+    def test_spare_on_other_node(self):
+        self.assertEqual(self.rpc._spares.queue[0][0], self.nodes[1].url)
+
+    def test_adopt_spare(self):
+        url, spare = self.rpc._spares.queue[0]
+        old = self.rpc.ws
+        self.nodes[0].drop()
+        self.assertEqual(self.rpc.get_block(5), {"previous": 4})
+        self.assertIs(self.rpc.ws, spare)
+        self.assertEqual(self.rpc.url, self.nodes[1].url)
+        self.assertFalse(old.connected)
+        # the adopted spare is replaced by one on the other node
+        wait_for(lambda: self.rpc._spares.qsize() == 1)
+        self.assertEqual(self.rpc._spares.queue[0][0], self.nodes[0].url)
+
+    def test_drop_dead_spare(self):
+        url, spare = self.rpc._spares.queue[0]
+        self.nodes[0].drop(self.nodes[0].connections[:1])
+        self.nodes[1].drop()
+        self.assertEqual(self.rpc.get_block(5), {"previous": 4})
+        self.assertIsNot(self.rpc.ws, spare)
+        self.assertFalse(spare.connected)
+        wait_for(lambda: self.rpc._spares.qsize() == 1)
+
+    def test_drop_silent_spare(self):
+        # the spare is connected but its node never answers the login
+        handle = self.nodes[1].handle
+        ignored = []
+
+        def ignore_first(request):
+            if not ignored:
+                ignored.append(request)
+                return None
+            return handle(request)
+
+        self.nodes[1].handle = ignore_first
+        url, spare = self.rpc._spares.queue[0]
+        self.rpc.timeout = None
+        self.nodes[0].drop(self.nodes[0].connections[:1])
+        with mock.patch.object(steemnoderpc, "spare_timeout", 0.2):
+            with self.assertLogs(steemnoderpc.log, "DEBUG") as logs:
+                self.assertEqual(self.rpc.get_block(5), {"previous": 4})
+        self.assertEqual(len(ignored), 1)
+        self.assertFalse(spare.connected)
+        self.assertIn(
+            "Dropping stale spare connection to %s" % url,
+            "\n".join(logs.output))
+
+    def test_open_wss(self):
+        with mock.patch("websocket.WebSocket") as WebSocket:
+            self.rpc._open("wss://example.com")
+            WebSocket.assert_called_once_with(
+                sslopt={"cert_reqs": steemnoderpc.ssl.CERT_NONE})
+            WebSocket.return_value.connect.assert_called_once_with(
+                "wss://example.com", timeout=2)
+
+
+class RPCTestcases(unittest.TestCase):
+
+    def setUp(self):
+        self.node = FakeNode()
+
+    def tearDown(self):
+        self.node.close()
+
+    def test_api_id_per_instance(self):
+        a = SteemNodeRPC(self.node.url, num_retries=0)
+        b = SteemNodeRPC(self.node.url, num_retries=0)
+        self.assertEqual(a.api_id, {"database": 2, "network_broadcast": 3})
+        self.assertIsNot(a.api_id, b.api_id)
+
+    def test_irreversible_block_cache(self):
+        rpc = SteemNodeRPC(self.node.url, num_retries=0, block_cache_size=2)
+        rpc.get_block = mock.Mock(side_effect=lambda num: {"previous": num - 1})
+        self.assertEqual(rpc.get_irreversible_block(1), {"previous": 0})
+        rpc.get_irreversible_block(2)
+        # hit, makes 1 the most recently used block
+        block = rpc.get_irreversible_block(1)
+        self.assertEqual(rpc.get_block.call_count, 2)
+        # modifying the returned block does not modify the cache
+        block["block_num"] = 1
+        self.assertEqual(rpc.get_irreversible_block(1), {"previous": 0})
+        # evicts 2
+        rpc.get_irreversible_block(3)
+        self.assertEqual(list(rpc._block_cache), [1, 3])
+        rpc.get_irreversible_block(2)
+        self.assertEqual(rpc.get_block.call_count, 4)
+
+    def test_irreversible_block_cache_disabled(self):
+        rpc = SteemNodeRPC(self.node.url, num_retries=0, block_cache_size=0)
+        rpc.get_block = mock.Mock(side_effect=lambda num: {"previous": num - 1})
+        rpc.get_irreversible_block(1)
+        rpc.get_irreversible_block(1)
+        self.assertEqual(rpc.get_block.call_count, 2)
+        self.assertEqual(len(rpc._block_cache), 0)
+
+    def test_irreversible_block_cache_default(self):
+        rpc = SteemNodeRPC(self.node.url, num_retries=0)
+        self.assertEqual(rpc.block_cache_size, 0)
+
+    def test_threads(self):
+        rpc = SteemNodeRPC(self.node.url, num_retries=0)
+        self.node.methods["echo"] = lambda value: value
+        errors = []
+        ids = itertools.count(1000)
+
+        def call(thread):
+            for i in range(20):
+                value = "%d-%d" % (thread, i)
+                payload = {"method": "call", "params": [0, "echo", [value]],
+                           "jsonrpc": "2.0", "id": next(ids)}
+                reply = _loads(rpc._send_recv(payload))
+                if reply["id"] != payload["id"] or reply["result"] != value:
+                    errors.append((payload, reply))
+                if rpc.rpcexec(dict(payload, id=next(ids))) != value:
+                    errors.append(payload)
+
+        threads = [threading.Thread(target=call, args=(t,)) for t in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+
+    def test_timeout(self):
+        rpc = SteemNodeRPC(self.node.url, num_retries=0, timeout=0.2)
+        self.node.handle = lambda request: None
+        with self.assertRaises(websocket.WebSocketTimeoutException):
+            rpc.ws.send(_dumps({"id": 1}))
+            rpc._recv()
+        with self.assertRaises(NumRetriesReached):
+            rpc.get_block(1)
+
+
+class BatchTestcases(unittest.TestCase):
+
+    def setUp(self):
+        self.node = FakeNode()
+        self.rpc = SteemNodeRPC(self.node.url, num_retries=0, batch=True)
+        self.payloads = [
+            {"method": "call", "params": [0, "get_block", [num]],
+             "jsonrpc": "2.0", "id": num}
+            for num in (1, 2)
+        ]
+
+    def tearDown(self):
+        self.node.close()
+
+    def test_register_apis(self):
+        self.assertEqual(
+            self.rpc.api_id, {"database": 2, "network_broadcast": 3})
+        # registered with a single request
+        self.assertIsInstance(self.node.requests[1], list)
+        with self.assertRaises(NoAccessApi):
+            self.rpc.register_apis(["market_history"])
+
+    def test_rpcexec_batch(self):
+        # replies may come in any order
+        handle = self.node.handle
+        self.node.handle = lambda request: handle(request)[::-1]
+        self.assertEqual(
+            self.rpc.rpcexec_batch(self.payloads),
+            [{"previous": 0}, {"previous": 1}])
+
+    def test_not_supported(self):
+        self.node.handle = lambda request: {
+            "id": None, "error": {"message": "Invalid request"}}
+        with self.assertRaisesRegex(RPCError, "Invalid request"):
+            self.rpc.rpcexec_batch(self.payloads)
+        self.node.handle = lambda request: "nope"
+        with self.assertRaisesRegex(RPCError, "not supported"):
+            self.rpc.rpcexec_batch(self.payloads)
+
+    def test_missing_id(self):
+        handle = self.node.handle
+        self.node.handle = lambda request: handle(request)[:1]
+        with self.assertRaisesRegex(RPCError, "No reply"):
+            self.rpc.rpcexec_batch(self.payloads)
+
+    def test_error_entry(self):
+        self.node.methods["get_block"] = lambda num: 1 / (num - 2)
+        with self.assertRaisesRegex(RPCError, "get_block: division by zero"):
+            self.rpc.rpcexec_batch(self.payloads)
+
+    def test_invalid_json(self):
+        with mock.patch.object(self.rpc, "_send_recv", return_value="{"):
+            with self.assertRaises(ValueError):
+                self.rpc.rpcexec_batch(self.payloads)